@@ -0,0 +1,44 @@
+import asyncio
+import importlib.util
+import os
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+FIXTURES_DIR = os.path.join(ROOT, "tests", "fixtures")
+
+
+@pytest.fixture(scope="session")
+def scraper():
+    # The engine is a script with spaces in its name, so it is loaded by path
+    for module in ("pandas", "playwright", "phonenumbers", "schedule", "tkinter"):
+        pytest.importorskip(module)
+    spec = importlib.util.spec_from_file_location("scraper_gui_14", os.path.join(ROOT, "Scraper GUI 14 .py"))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture(scope="session")
+def chromium():
+    # Skips browser tests where Playwright's Chromium is not installed or cannot start
+    from playwright.async_api import async_playwright
+
+    async def probe():
+        async with async_playwright() as p:
+            browser = await p.chromium.launch()
+            await browser.close()
+
+    try:
+        asyncio.run(probe())
+    except Exception as e:
+        pytest.skip(f"Chromium unavailable: {str(e).splitlines()[0]}")
+
+
+@pytest.fixture(scope="session")
+def read_fixture():
+    # Recorded payloads are read verbatim, line endings included
+    def read(name):
+        with open(os.path.join(FIXTURES_DIR, name), encoding="utf-8", newline="") as f:
+            return f.read()
+    return read
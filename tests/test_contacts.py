@@ -0,0 +1,52 @@
+import os
+
+import pytest
+
+SAMPLES = {
+    "barber_obfuscated.html": {
+        "emails": ["bookings@fadefactory.com", "info@fadefactory.com", "mike@fadefactory.com"],
+        "phones": ["+18175550199"],
+    },
+    "landing_page_large.html": {"emails": ["appointments@luxehairatx.com"], "phones": ["+15125550177"]},
+    "salon_cloudflare.html": {"emails": ["hello@glowsalon.com"], "phones": ["+12145550142"]},
+    "spa_plain.html": {"emails": ["front.desk@serenityspa.net", "jobs@serenityspa.net"], "phones": []},
+}
+
+
+@pytest.mark.parametrize("name", sorted(SAMPLES))
+def test_sample_pages(scraper, name):
+    with open(os.path.join(scraper.CONTACT_SAMPLES_DIR, name), "rb") as f:
+        page = f.read()
+    assert scraper.extract_contacts(page) == SAMPLES[name]
+    assert scraper.extract_contacts(page.decode("utf-8")) == SAMPLES[name]
+
+
+def test_samples_dir_is_fully_covered(scraper):
+    assert sorted(os.listdir(scraper.CONTACT_SAMPLES_DIR)) == sorted(SAMPLES)
+
+
+@pytest.mark.parametrize("html, emails", [
+    # Placeholder and error-reporting domains match on a dot boundary only
+    ("you@example.com x@mail.example.com y@notexample.com", ["y@notexample.com"]),
+    ("dsn a1b2@o1.ingest.sentry.io b@sentry.io.evil.com", ["b@sentry.io.evil.com"]),
+    ("hi@mydomain.com you@yourdomain.com", ["hi@mydomain.com"]),
+    # Retina asset names are not addresses
+    ('<img src="logo@2x.png" srcset="s12@2x.jpg 2x"> Hi@Salon.com', ["hi@salon.com"]),
+    ("a&#64;b.com c&#x40;d.com e%40f.com", ["a@b.com", "c@d.com", "e@f.com"]),
+    ("JOE [ at ] shop [dot] com, ann (at) shop.com", ["ann@shop.com", "joe@shop.com"]),
+    ('<a href="mailto:a@b.com,c@d.com?subject=Hi">', ["a@b.com", "c@d.com"]),
+    ('<a href="/cdn-cgi/l/email-protection#5a323f3636351a3d36352d293b36353474393537">', ["hello@glowsalon.com"]),
+    ("no contacts here", []),
+])
+def test_email_edge_cases(scraper, html, emails):
+    assert scraper.extract_contacts(html)["emails"] == emails
+
+
+def test_tel_links_only(scraper):
+    html = '<a href="tel:(512) 555-0142">call</a> or text 512-555-0199'
+    assert scraper.extract_contacts(html) == {"emails": [], "phones": ["+15125550142"]}
+
+
+def test_max_bytes_truncates(scraper):
+    html = "x" * 100 + " late@salon.com"
+    assert scraper.extract_contacts(html, max_bytes=50)["emails"] == []
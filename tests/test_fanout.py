@@ -0,0 +1,23 @@
+import pytest
+
+
+@pytest.mark.parametrize("company_type, expected", [
+    ("Nail Salon", ["nail salon", "nail spa", "manicure"]),
+    ("Nail Spa", ["nail salon", "nail spa", "manicure"]),
+    ("Salon Beauty Shop", ["salon", "beauty salon", "beauty shop", "hair salon"]),
+    ("Day Spa", ["spa", "day spa", "massage spa"]),
+    ("Day Spa and Nail Salon", ["nail salon", "nail spa", "manicure", "spa", "day spa", "massage spa"]),
+    ("salon and nail salon", ["salon", "beauty salon", "beauty shop", "hair salon", "nail salon", "nail spa", "manicure"]),
+    ("Barbershop", ["barber", "barber shop", "barbershop"]),
+    ("Tattoo Parlor", ["Tattoo Parlor"]),
+])
+def test_expand_company_types(scraper, company_type, expected):
+    assert scraper.expand_company_types(company_type) == expected
+
+
+def test_plan_fanout_is_area_major_without_unrelated_groups(scraper):
+    jobs = scraper.plan_fanout("USA", "TX", "Nail Salon", "city")
+    terms = {job["id"].split("|")[0] for job in jobs}
+    assert terms == {"nail salon", "nail spa", "manicure"}
+    assert [job["id"].split("|")[0] for job in jobs[:3]] == ["nail salon", "nail spa", "manicure"]
+    assert len({job["id"].split("|")[1] for job in jobs[:3]}) == 1
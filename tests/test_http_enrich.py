@@ -0,0 +1,39 @@
+import asyncio
+
+import pytest
+
+httpx = pytest.importorskip("httpx")
+
+SMALL_STATIC = ('<html><body><h1>Glow Salon</h1><p>Book: <a href="mailto:hello@glowsalonatx.com">email us</a> '
+                'or <a href="tel:+15125550142">call</a></p></body></html>')
+SPA_SHELL = '<html><head><script src="/app.js"></script></head><body><div id="root"></div></body></html>'
+
+
+def lookup(scraper, tmp_path, pages):
+    def handler(request):
+        return httpx.Response(200, headers={"content-type": "text/html"}, text=pages.get(request.url.path, ""))
+
+    async def run():
+        enricher = scraper.HttpEnricher(log=lambda msg: None,
+                                        cache=scraper.EnrichmentCache(str(tmp_path / "cache.json")))
+        await enricher.client.aclose()
+        enricher.client = httpx.AsyncClient(transport=httpx.MockTransport(handler), follow_redirects=True)
+        try:
+            return await enricher.contacts("https://glowsalonatx.com/"), enricher.counts
+        finally:
+            await enricher.close()
+
+    return asyncio.run(run())
+
+
+def test_small_static_page_keeps_its_contacts(scraper, tmp_path):
+    assert scraper.looks_like_js_shell(SMALL_STATIC)
+    found, counts = lookup(scraper, tmp_path, {"/": SMALL_STATIC})
+    assert found == {"emails": ["hello@glowsalonatx.com"], "phones": ["+15125550142"]}
+    assert counts["http"] == 1 and counts["browser"] == 0
+
+
+def test_empty_js_shell_escalates_to_the_browser(scraper, tmp_path):
+    found, counts = lookup(scraper, tmp_path, {"/": SPA_SHELL})
+    assert found is None
+    assert counts["browser"] == 1 and counts["http"] == 0
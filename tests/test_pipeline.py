@@ -0,0 +1,48 @@
+import asyncio
+import threading
+
+
+class StubPage:
+    async def close(self):
+        pass
+
+
+class StubContext:
+    # new_page either hands out an idle tab or fails like a crashed browser would
+    def __init__(self, broken=False):
+        self.broken = broken
+
+    async def new_page(self):
+        if self.broken:
+            raise RuntimeError("Target page, context or browser has been closed")
+        return StubPage()
+
+
+def test_tiling_ends_when_every_tile_worker_dies(scraper):
+    logs = []
+
+    async def run():
+        source = scraper.tiled_place_urls(StubContext(broken=True), "salon", [29.0, -98.0, 31.0, -96.0],
+                                          scraper.SELECTOR_CONFIG, "", logs.append, workers=2)
+        return await asyncio.wait_for(
+            scraper.run_pipeline(source, StubContext(), logs.append, threading.Event(), detail_tabs=2), 5)
+
+    assert asyncio.run(run()) == []
+    assert any("All tile workers stopped" in msg and "16 tiles left" in msg for msg in logs)
+    assert any(msg.startswith("Tiling finished: 0 tiles scanned") for msg in logs)
+
+
+def test_pipeline_ends_when_every_detail_tab_dies(scraper):
+    logs = []
+
+    async def source():
+        for i in range(50):
+            yield f"https://www.google.com/maps/place/Salon+{i}/"
+
+    async def run():
+        return await asyncio.wait_for(
+            scraper.run_pipeline(source(), StubContext(broken=True), logs.append, threading.Event(),
+                                 detail_tabs=2, queue_size=4), 5)
+
+    assert asyncio.run(run()) == []
+    assert "All detail tabs stopped, abandoning the remaining listings." in logs
@@ -0,0 +1,103 @@
+import asyncio
+import http.server
+import threading
+import time
+
+import pytest
+
+
+@pytest.fixture
+def origin():
+    # Plain HTTP site on 127.0.0.1 that every proxied navigation ends up at
+    class Handler(http.server.BaseHTTPRequestHandler):
+        def do_GET(self):
+            body = b"<!doctype html><title>ok</title><p>ok</p>"
+            self.send_response(200)
+            self.send_header("Content-Type", "text/html")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+
+
+async def navigate(scraper, browser, pool, proxy, url, times):
+    # Chromium skips proxies for loopback unless "<-loopback>" removes that rule
+    context = await browser.new_context(proxy=dict(scraper.proxy_settings(proxy), bypass="<-loopback>"))
+    try:
+        await pool.install(context, proxy)
+        page = await context.new_page()
+        for i in range(times):
+            try:
+                await page.goto(f"{url}/?n={i}", wait_until="domcontentloaded")
+            except Exception:
+                pass
+    finally:
+        await context.close()
+
+
+def test_scores_reorder_after_slow_and_failing_navigations(scraper, chromium, origin, tmp_path):
+    from playwright.async_api import async_playwright
+
+    async def run():
+        slow = scraper.LocalProxy(delay=0.4)
+        flaky = scraper.LocalProxy(fail_rate=1.0)
+        await slow.start()
+        await flaky.start()
+        pool = scraper.ProxyPool([flaky.url, slow.url], path=str(tmp_path / "health.json"), rate=50, burst=50)
+        before = sorted(pool.proxies, key=pool.score)
+        try:
+            async with async_playwright() as p:
+                browser = await p.chromium.launch()
+                try:
+                    await navigate(scraper, browser, pool, slow.url, origin, 3)
+                    await navigate(scraper, browser, pool, flaky.url, origin, 3)
+                finally:
+                    await browser.close()
+        finally:
+            await slow.stop()
+            await flaky.stop()
+        return pool, slow, flaky, before
+
+    pool, slow, flaky, before = asyncio.run(run())
+    assert before == [flaky.url, slow.url]  # untried proxies tie, so list order decides
+    slow_health = pool.health[scraper.proxy_label(slow.url)]
+    flaky_health = pool.health[scraper.proxy_label(flaky.url)]
+    assert slow_health["requests"] == 3 and slow_health["errors"] == 0
+    assert 0.4 <= slow_health["latency"] < 1.0
+    assert flaky_health["errors"] == 3 and flaky_health["latency"] is None
+    assert sorted(pool.proxies, key=pool.score) == [slow.url, flaky.url]
+    assert pool.acquire() == slow.url
+
+
+def test_token_bucket_throttles_navigations(scraper, chromium, origin, tmp_path):
+    from playwright.async_api import async_playwright
+
+    async def run(rate, burst):
+        proxy = scraper.LocalProxy()
+        await proxy.start()
+        pool = scraper.ProxyPool([proxy.url], path=str(tmp_path / "health.json"), rate=rate, burst=burst)
+        try:
+            async with async_playwright() as p:
+                browser = await p.chromium.launch()
+                try:
+                    started = time.monotonic()
+                    await navigate(scraper, browser, pool, proxy.url, origin, 5)
+                    return time.monotonic() - started, pool
+                finally:
+                    await browser.close()
+        finally:
+            await proxy.stop()
+
+    unthrottled, _ = asyncio.run(run(rate=100, burst=100))
+    throttled, pool = asyncio.run(run(rate=2, burst=1))
+    # One token up front, then one every 0.5s for the other four navigations
+    assert throttled >= 1.9
+    assert throttled > unthrottled + 1.5
+    assert pool.health[scraper.proxy_label(pool.proxies[0])]["requests"] == 5
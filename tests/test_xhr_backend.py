@@ -0,0 +1,76 @@
+import asyncio
+import urllib.parse
+
+SEARCH_PAGE = """<!doctype html><title>loading</title><script>
+(async () => {
+  for (const page of ["1", "2"]) {
+    const response = await fetch("/search?tbm=map&authuser=0&hl=en&gl=us&q=salon+beauty+shop+texas+usa&page=" + page);
+    await response.text();
+  }
+  document.title = "done";
+})();
+</script>"""
+
+
+def place(name, address, phone, website, place_id):
+    return {
+        "Name": name, "Address": address, "Phone": phone, "Website": website, "Emails": "",
+        "Place URL": f"https://www.google.com/maps/place/?q=place_id:{place_id}"
+    }
+
+
+PAGE_1 = [
+    place("Glow Salon & Spa", "1200 S Congress Ave, Austin, TX 78704", "(512) 555-0142",
+          "https://glowsalonatx.com/", "ChIJglowSalonAtx0001"),
+    place("Fade Factory Barbers", "415 Main St, Fort Worth, TX 76102", "N/A", "N/A", "ChIJfadeFactoryFtw0002"),
+    place("Serenity Day Spa", "88 Oak Lawn Ave, Dallas, TX 75207", "(214) 555-0190",
+          "https://serenityspa.net/", "ChIJserenitySpaDal0003"),
+]
+PAGE_2 = [
+    PAGE_1[2],
+    place("Lone Star Nails", "5 Market Sq, San Antonio, TX 78205", "+1 210-555-0175", "N/A", "ChIJloneStarNailsSat0004"),
+]
+
+
+def test_parse_search_payload_wrapped_and_bare(scraper, read_fixture):
+    # page 1 is the {"c":0,"d":")]}'..."}/*""*/ wrapper, page 2 a bare )]}' array
+    assert scraper.parse_search_payload(read_fixture("search_tbm_map_page1.txt")) == PAGE_1
+    assert scraper.parse_search_payload(read_fixture("search_tbm_map_page2.txt")) == PAGE_2
+
+
+def test_collector_records_from_served_payloads(scraper, chromium, read_fixture, tmp_path):
+    from playwright.async_api import async_playwright
+
+    async def serve(route):
+        url = urllib.parse.urlsplit(route.request.url)
+        if url.path == "/search" and "tbm=map" in url.query:
+            page = urllib.parse.parse_qs(url.query)["page"][0]
+            await route.fulfill(status=200, content_type="application/json; charset=UTF-8",
+                                body=read_fixture(f"search_tbm_map_page{page}.txt"))
+        else:
+            await route.fulfill(status=200, content_type="text/html", body=SEARCH_PAGE)
+
+    async def run():
+        async with async_playwright() as p:
+            browser = await p.chromium.launch()
+            try:
+                page = await browser.new_page()
+                collector = scraper.SearchXHRCollector(record_dir=str(tmp_path))
+                collector.attach(page)
+                await page.route("**/*", serve)
+                await page.goto("https://www.google.com/maps/search/salon+beauty+shop+texas+usa")
+                await page.wait_for_function("document.title === 'done'")
+                # Response handlers run as their own tasks
+                for _ in range(50):
+                    if collector.recorded == 2:
+                        break
+                    await asyncio.sleep(0.1)
+                return collector
+            finally:
+                await browser.close()
+
+    collector = asyncio.run(run())
+    by_url = lambda records: sorted(records, key=lambda r: r["Place URL"])
+    assert by_url(collector.results()) == by_url(PAGE_1 + PAGE_2[1:])
+    recorded = sorted(path.read_text(encoding="utf-8") for path in tmp_path.iterdir())
+    assert recorded == sorted([read_fixture("search_tbm_map_page1.txt"), read_fixture("search_tbm_map_page2.txt")])